@@ -8,20 +8,24 @@ Usage:
 
 import os
 import logging
+import logging.handlers
 import sys
-from pathlib import Path
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 from datetime import datetime
 import argparse
 from contextlib import contextmanager
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
 from typing import List, Tuple, Dict
-import time
-from dataclasses import dataclass
+from dataclasses import dataclass, astuple
 import threading
+import queue
+import sqlite3
 import fnmatch
+import hashlib
+import re
 import subprocess
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn, MofNCompleteColumn
 
@@ -50,7 +54,7 @@ def prevent_sleep():
         yield
 
 
-@dataclass
+@dataclass(slots=True)
 class BackupStats:
     """Statistics tracking for the backup verification process."""
     total_files_scanned: int = 0
@@ -64,34 +68,71 @@ class BackupStats:
 
     def __add__(self, other):
         """Allow adding stats objects together."""
-        return BackupStats(
-            total_files_scanned=self.total_files_scanned + other.total_files_scanned,
-            files_already_in_s3=self.files_already_in_s3 + other.files_already_in_s3,
-            files_uploaded_to_s3=self.files_uploaded_to_s3 + other.files_uploaded_to_s3,
-            upload_failures=self.upload_failures + other.upload_failures,
-            scan_errors=self.scan_errors + other.scan_errors,
-            total_bytes_uploaded=self.total_bytes_uploaded + other.total_bytes_uploaded,
-            files_deleted=self.files_deleted + other.files_deleted,
-            delete_failures=self.delete_failures + other.delete_failures
-        )
+        return BackupStats(*(a + b for a, b in zip(astuple(self), astuple(other))))
+
+    def merge(self, other):
+        """Fold another stats object into this one in place (no allocation)."""
+        self.total_files_scanned += other.total_files_scanned
+        self.files_already_in_s3 += other.files_already_in_s3
+        self.files_uploaded_to_s3 += other.files_uploaded_to_s3
+        self.upload_failures += other.upload_failures
+        self.scan_errors += other.scan_errors
+        self.total_bytes_uploaded += other.total_bytes_uploaded
+        self.files_deleted += other.files_deleted
+        self.delete_failures += other.delete_failures
 
 class S3BackupManager:
     """Optimized S3 operations for backup verification and upload."""
 
+    # Concurrency ceilings, shared between transfer tuning and the sizing of
+    # the urllib3 connection pool: parts per multipart upload, and threads
+    # fanning out residual existence lookups in batch_check_exists.
+    TRANSFER_CONCURRENCY = 8
+    LOOKUP_CONCURRENCY = 16
+
     def __init__(self, max_pool_connections: int = 50, endpoint_url: str = None):
         self.s3_client = None
-        self._s3_cache: Dict[str, bool] = {}
+        # Single cache layer: key -> object size, guarded by one lock, with
+        # -1 meaning "known missing". Keyed by object key alone — a sync run
+        # only ever talks to one bucket, so the bucket adds nothing to the
+        # lookup. Entries come from bulk prefix listing, HEAD fallbacks, and
+        # upload/delete bookkeeping.
+        self._size_by_key: Dict[str, int] = {}
+        # ETags captured alongside sizes during listing/HEAD, for the
+        # optional checksum comparison of same-size files. Single-part ETags
+        # are MD5 hex digests for plaintext/SSE-S3 objects; multipart and
+        # SSE-KMS/SSE-C ETags are opaque.
+        self._etag_by_key: Dict[str, str] = {}
         self._cache_lock = threading.Lock()
+        # Prefixes whose keys have been fully listed. Any key covered by one
+        # of these is authoritatively known: a cache miss means the object
+        # does not exist, so no HEAD fallback is needed.
+        self._loaded_prefixes: set = set()
         self.max_pool_connections = max_pool_connections
         self.endpoint_url = endpoint_url
+        # Shared transfer tuning: large files (RAWs, PSBs) upload as parallel
+        # multipart parts; small files go through as single PUTs.
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=self.TRANSFER_CONCURRENCY,
+            use_threads=True,
+        )
         self._initialize_client()
 
     def _initialize_client(self):
         """Initialize S3 client with optimized configuration."""
         try:
-            config = BotoConfig(max_pool_connections=self.max_pool_connections)
+            # One client is shared across all worker threads, so size the
+            # urllib3 pool for full concurrency and let botocore's adaptive
+            # retry mode back off on throttling instead of our callers.
+            self._client_config = BotoConfig(
+                max_pool_connections=self.max_pool_connections,
+                retries={'max_attempts': 5, 'mode': 'adaptive'},
+                tcp_keepalive=True,
+            )
             self.s3_client = boto3.client(
-                's3', config=config, endpoint_url=self.endpoint_url
+                's3', config=self._client_config, endpoint_url=self.endpoint_url
             )
             
             # Test basic connectivity
@@ -146,63 +187,167 @@ class S3BackupManager:
             logging.error(f"Error type: {type(e).__name__}")
             return False
     
+    def ensure_bucket_region(self, bucket: str):
+        """Pin the client to the bucket's home region.
+
+        When the client's region disagrees with the bucket's, botocore
+        silently resolves every mismatched call through a region-discovery
+        redirect costing extra HTTP round trips. Resolve the bucket location
+        once and rebuild the client against the right regional endpoint.
+        """
+        if self.endpoint_url:
+            # Custom S3-compatible endpoints don't do region routing
+            return
+
+        try:
+            response = self.s3_client.get_bucket_location(Bucket=bucket)
+            region = response['LocationConstraint'] or 'us-east-1'
+        except Exception as e:
+            logging.warning(f"Could not resolve region for bucket '{bucket}': {e}")
+            return
+
+        if region != self.s3_client.meta.region_name:
+            logging.info(f"Pinning S3 client to bucket region '{region}'")
+            self.s3_client = boto3.client(
+                's3', config=self._client_config, region_name=region
+            )
+
     def file_exists(self, bucket: str, key: str) -> Tuple[bool, int]:
         """Check if file exists in S3 with thread-safe caching.
 
+        Keys under a prefix that has been bulk-listed via load_prefix_cache
+        are answered entirely from the cache — a miss there means the object
+        does not exist, so no HEAD request is issued. A key outside any
+        listed prefix triggers a one-time listing of its parent prefix, so
+        the first lookup in a directory pays one LIST that answers every
+        sibling key; HEAD remains only as the fallback when listing fails.
+
         Returns:
             (exists, size) — size is the S3 object size in bytes, or 0 if not found.
         """
-        cache_key = f"{bucket}/{key}"
+        with self._cache_lock:
+            size = self._size_by_key.get(key)
+            if size is not None:
+                return (size >= 0, max(size, 0))
+            if any(key.startswith(p) for p in self._loaded_prefixes):
+                self._size_by_key[key] = -1
+                return (False, 0)
+
+        # Warm the cache for the key's parent prefix: ~1000 keys per LIST
+        # round trip vs one key per HEAD round trip.
+        parent = key.rsplit('/', 1)[0] + '/' if '/' in key else ''
+        self.load_prefix_cache(bucket, parent)
 
         with self._cache_lock:
-            if cache_key in self._s3_cache:
-                return self._s3_cache[cache_key]
+            size = self._size_by_key.get(key)
+            if size is not None:
+                return (size >= 0, max(size, 0))
+            if parent in self._loaded_prefixes:
+                self._size_by_key[key] = -1
+                return (False, 0)
 
         try:
             response = self.s3_client.head_object(Bucket=bucket, Key=key)
-            result = (True, response['ContentLength'])
+            size = response['ContentLength']
+            etag = response.get('ETag', '').strip('"')
         except ClientError as e:
-            if e.response['Error']['Code'] == "404":
-                result = (False, 0)
-            else:
-                logging.warning(f"Error checking S3 object {key}: {e}")
-                result = (False, 0)
+            if e.response['Error']['Code'] != "404":
+                logging.warning("Error checking S3 object %s: %s", key, e)
+            size = -1
+            etag = None
 
         with self._cache_lock:
-            self._s3_cache[cache_key] = result
+            self._size_by_key[key] = size
+            if etag:
+                self._etag_by_key[key] = etag
 
-        return result
+        return (size >= 0, max(size, 0))
     
-    def upload_file(self, bucket: str, key: str, src_file: Path) -> Tuple[bool, int]:
-        """Upload file to S3 with retry logic. Returns (success, bytes_uploaded)."""
-        max_retries = 3
-        file_size = 0
-        
+    def get_etag(self, key: str) -> str:
+        """Return the cached ETag for a key, or None if not known."""
+        with self._cache_lock:
+            return self._etag_by_key.get(key)
+
+    def upload_file(self, bucket: str, key: str, src_file,
+                    file_size: int = None, if_absent: bool = False) -> Tuple[bool, int]:
+        """Upload a file or file-like object to S3, multipart for large files.
+
+        src_file may be a path or anything with a read() method (the latter
+        streams through upload_fileobj without touching disk). Pass file_size
+        when the caller already knows it (the scanner captures it from the
+        directory listing) to avoid a redundant stat; for seekable file
+        objects the size is measured with seek/tell.
+        With if_absent=True, bodies below the multipart threshold upload as a
+        single conditional PUT (If-None-Match: *) — if the key appeared since
+        the caller's existence check, S3 rejects the write with 412 and
+        FileExistsError is raised instead of re-uploading. Larger bodies fall
+        back to the normal multipart path, which has no conditional-write
+        equivalent. Retries are handled by botocore's adaptive retry mode and
+        by s3transfer's per-part retry for multipart uploads.
+
+        Returns (success, bytes_uploaded).
+        """
+        is_fileobj = hasattr(src_file, 'read')
+        if file_size is None:
+            if is_fileobj:
+                try:
+                    pos = src_file.tell()
+                    src_file.seek(0, os.SEEK_END)
+                    file_size = src_file.tell() - pos
+                    src_file.seek(pos)
+                except (OSError, ValueError):
+                    # Unseekable stream: size stays unknown and the multipart
+                    # path below streams it chunk by chunk.
+                    file_size = None
+            else:
+                try:
+                    file_size = os.stat(src_file).st_size
+                except Exception as e:
+                    logging.error(f"Could not get file size for {src_file}: {e}")
+                    return False, 0
+
         try:
-            file_size = src_file.stat().st_size
+            if if_absent and file_size is not None and \
+                    file_size <= self._transfer_config.multipart_threshold:
+                if is_fileobj:
+                    self.s3_client.put_object(
+                        Bucket=bucket, Key=key, Body=src_file, IfNoneMatch='*'
+                    )
+                else:
+                    with open(src_file, 'rb') as body:
+                        self.s3_client.put_object(
+                            Bucket=bucket, Key=key, Body=body, IfNoneMatch='*'
+                        )
+            elif is_fileobj:
+                self.s3_client.upload_fileobj(
+                    src_file, bucket, key, Config=self._transfer_config
+                )
+            else:
+                self.s3_client.upload_file(
+                    Filename=str(src_file), Bucket=bucket, Key=key,
+                    Config=self._transfer_config
+                )
+        except ClientError as e:
+            if if_absent and e.response['Error']['Code'] == 'PreconditionFailed':
+                logging.debug("Object appeared in S3 before upload: %s", key)
+                raise FileExistsError(key) from e
+            logging.error(f"Failed to upload {src_file} to S3 ({key}): {e}")
+            return False, 0
         except Exception as e:
-            logging.error(f"Could not get file size for {src_file}: {e}")
+            logging.error(f"Failed to upload {src_file} to S3 ({key}): {e}")
             return False, 0
-        
-        for attempt in range(max_retries):
-            try:
-                self.s3_client.upload_file(Filename=str(src_file), Bucket=bucket, Key=key)
-                
-                # Update cache
-                cache_key = f"{bucket}/{key}"
-                with self._cache_lock:
-                    self._s3_cache[cache_key] = (True, file_size)
-                
-                logging.debug(f"Successfully uploaded {src_file.name} ({file_size:,} bytes) to s3://{bucket}/{key}")
-                return True, file_size
-                
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    logging.error(f"Failed to upload {src_file} to S3 ({key}) after {max_retries} attempts: {e}")
-                    return False, 0
-                time.sleep(2 ** attempt)  # Exponential backoff
-        
-        return False, 0
+
+        # Update cache (size unknown only for unseekable streams); any
+        # previously listed ETag is stale after the overwrite.
+        if file_size is not None:
+            with self._cache_lock:
+                self._size_by_key[key] = file_size
+                self._etag_by_key.pop(key, None)
+
+        name = key if is_fileobj else os.path.basename(str(src_file))
+        logging.debug("Successfully uploaded %s (%s bytes) to s3://%s/%s",
+                      name, file_size, bucket, key)
+        return True, file_size or 0
     
     def list_objects(self, bucket: str, prefix: str) -> List[str]:
         """List all object keys under a prefix."""
@@ -218,37 +363,86 @@ class S3BackupManager:
 
         return keys
 
-    def delete_object(self, bucket: str, key: str) -> bool:
-        """Delete an object from S3."""
-        try:
-            self.s3_client.delete_object(Bucket=bucket, Key=key)
+    def delete_objects(self, bucket: str, keys: List[str]) -> Tuple[int, int]:
+        """Delete objects via the batch DeleteObjects API, 1000 keys per call.
+
+        One request replaces up to 1000 individual DELETE round trips.
+        Returns (deleted, failed).
+        """
+        deleted = 0
+        failed = 0
+        for start in range(0, len(keys), 1000):
+            chunk = keys[start:start + 1000]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=bucket,
+                    Delete={'Objects': [{'Key': k} for k in chunk],
+                            'Quiet': True},
+                )
+            except Exception as e:
+                logging.error(f"Failed to delete {len(chunk)} objects from s3://{bucket}: {e}")
+                failed += len(chunk)
+                continue
+
+            errors = response.get('Errors', [])
+            for err in errors:
+                logging.error("Failed to delete s3://%s/%s: %s",
+                              bucket, err.get('Key'), err.get('Message'))
+            error_keys = {err.get('Key') for err in errors}
+            failed += len(errors)
+            deleted += len(chunk) - len(errors)
+
             with self._cache_lock:
-                cache_key = f"{bucket}/{key}"
-                self._s3_cache.pop(cache_key, None)
-            return True
-        except Exception as e:
-            logging.error(f"Failed to delete s3://{bucket}/{key}: {e}")
-            return False
+                for k in chunk:
+                    if k not in error_keys:
+                        self._size_by_key[k] = -1
+                        self._etag_by_key.pop(k, None)
+
+        return deleted, failed
+
+    def delete_object(self, bucket: str, key: str) -> bool:
+        """Delete a single object from S3."""
+        deleted, _ = self.delete_objects(bucket, [key])
+        return deleted == 1
 
     def load_prefix_cache(self, bucket: str, prefix: str) -> int:
         """Bulk-load all S3 object keys and sizes under a prefix into the cache.
 
-        Returns the number of objects found.
+        One paginated ListObjectsV2 pass covers up to 1000 keys per request,
+        replacing one HEAD round-trip per file. After a successful load the
+        prefix is marked authoritative, so existence checks for keys under it
+        never fall back to HEAD — a cache miss means the object is absent.
+
+        Returns the number of objects found; an already-loaded prefix
+        returns immediately without re-listing.
         """
+        with self._cache_lock:
+            if prefix in self._loaded_prefixes:
+                return 0
+
         count = 0
         paginator = self.s3_client.get_paginator('list_objects_v2')
 
         try:
-            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
-                for obj in page.get('Contents', []):
-                    cache_key = f"{bucket}/{obj['Key']}"
-                    with self._cache_lock:
-                        self._s3_cache[cache_key] = (True, obj['Size'])
-                    count += 1
+            # Ask for full pages explicitly: 1000 keys per round trip is the
+            # S3 ListObjectsV2 maximum, so page count is the floor already.
+            pages = paginator.paginate(Bucket=bucket, Prefix=prefix,
+                                       PaginationConfig={'PageSize': 1000})
+            for page in pages:
+                with self._cache_lock:
+                    for obj in page.get('Contents', []):
+                        self._size_by_key[obj['Key']] = obj['Size']
+                        self._etag_by_key[obj['Key']] = obj['ETag'].strip('"')
+                        count += 1
         except Exception as e:
             logging.warning(f"Error listing objects under s3://{bucket}/{prefix}: {e}")
+            return count
+
+        with self._cache_lock:
+            self._loaded_prefixes.add(prefix)
 
-        logging.info(f"Loaded {count:,} existing S3 objects into cache")
+        logging.debug("Loaded %d existing S3 objects under s3://%s/%s into cache",
+                      count, bucket, prefix)
         return count
 
     def batch_check_exists(self, bucket: str, keys: List[str]) -> Dict[str, Tuple[bool, int]]:
@@ -259,139 +453,504 @@ class S3BackupManager:
         """
         results = {}
 
-        # Check cache first
+        # Check cache first. The dict keys view supports set operations in
+        # C, so membership for the whole batch is one hash-probing pass and
+        # the Python-level loop only runs over actual hits. Misses covered
+        # by an authoritatively listed prefix are new local files — answer
+        # and negative-cache them in the same locked pass, no I/O needed.
         uncached_keys = []
         with self._cache_lock:
+            sizes = self._size_by_key
+            for key in sizes.keys() & keys:
+                size = sizes[key]
+                results[key] = (size >= 0, max(size, 0))
+            loaded = tuple(self._loaded_prefixes)
             for key in keys:
-                cache_key = f"{bucket}/{key}"
-                if cache_key in self._s3_cache:
-                    results[key] = self._s3_cache[cache_key]
+                if key in results:
+                    continue
+                if loaded and key.startswith(loaded):
+                    sizes[key] = -1
+                    results[key] = (False, 0)
                 else:
                     uncached_keys.append(key)
 
-        # Check uncached keys
-        for key in uncached_keys:
-            results[key] = self.file_exists(bucket, key)
+        # Only keys outside every loaded prefix reach here — each needs a
+        # real LIST/HEAD, which is pure round-trip latency worth overlapping.
+        if len(uncached_keys) > 1:
+            with ThreadPoolExecutor(
+                    max_workers=min(self.LOOKUP_CONCURRENCY,
+                                    len(uncached_keys))) as executor:
+                lookups = executor.map(
+                    lambda k: self.file_exists(bucket, k), uncached_keys)
+                for key, result in zip(uncached_keys, lookups):
+                    results[key] = result
+        elif uncached_keys:
+            results[uncached_keys[0]] = self.file_exists(bucket, uncached_keys[0])
 
         return results
 
 class FileScanner:
     """Handles recursive file scanning with error handling."""
 
-    def __init__(self, source_root: Path, exclude_patterns: List[str] = None):
-        self.source_root = source_root
+    def __init__(self, source_root, exclude_patterns: List[str] = None,
+                 scan_workers: int = 8, dedup_hardlinks: bool = False):
+        # Normalize to a plain string up front; everything downstream works
+        # on str paths (pathlib costs an allocation and a parse per object).
+        self.source_root = os.fspath(source_root)
         self.exclude_patterns = exclude_patterns or []
+        # Fold all patterns into one alternation so the per-file filter is a
+        # single C-level regex match instead of N fnmatch calls. fnmatch
+        # normcases both sides, which folds case on Windows; keep that
+        # behavior by compiling case-insensitively wherever normcase does.
+        flags = re.IGNORECASE if os.path.normcase('A') == 'a' else 0
+        self._exclude_re = re.compile(
+            "(?:" + "|".join(fnmatch.translate(p) for p in self.exclude_patterns) + ")",
+            flags
+        ) if self.exclude_patterns else None
+        self.scan_workers = scan_workers
+        self.dedup_hardlinks = dedup_hardlinks
+        # (st_dev, st_ino) pairs already emitted, so additional hardlinks to
+        # the same inode are skipped. Only consulted when dedup is enabled.
+        self._seen_inodes = set()
+        self._inode_lock = threading.Lock()
 
     def _is_excluded(self, filename: str) -> bool:
         """Check if a filename matches any exclude pattern."""
-        return any(fnmatch.fnmatch(filename, pat) for pat in self.exclude_patterns)
+        return self._exclude_re is not None and \
+            self._exclude_re.match(filename) is not None
+
+    def _process_directory(self, dir_path: str, rel_prefix: str,
+                           files: List[Tuple[str, str, int, int]],
+                           subdirs: List[Tuple[str, str]]):
+        """Scan a single directory, collecting its files and subdirectories.
+
+        DirEntry type checks are served from the directory listing itself
+        (no extra stat per file), and relative paths are built incrementally
+        with '/' separators instead of re-parsing each path. File sizes and
+        mtimes come from DirEntry.stat, whose result is cached on the entry
+        (and on Windows populated for free from the find data), so
+        downstream code never needs to stat the file again.
+        """
+        # Hoist lookups out of the per-entry loop; this runs once per file in
+        # the library and attribute resolution is the main interpreter cost.
+        add_file = files.append
+        add_subdir = subdirs.append
+        is_excluded = self._is_excluded
+
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            add_subdir((entry.path, rel_prefix + entry.name + "/"))
+                        elif entry.is_file(follow_symlinks=False):
+                            if is_excluded(entry.name):
+                                logging.debug("Excluded: %s", entry.name)
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            if self.dedup_hardlinks:
+                                if st.st_ino == 0 and sys.platform == "win32":
+                                    # DirEntry.stat on Windows is built from
+                                    # the find data and leaves st_ino and
+                                    # st_nlink at 0; link detection needs the
+                                    # full stat.
+                                    st = os.stat(entry.path)
+                                if st.st_nlink > 1 and st.st_ino:
+                                    inode = (st.st_dev, st.st_ino)
+                                    with self._inode_lock:
+                                        if inode in self._seen_inodes:
+                                            logging.debug("Skipping hardlink duplicate: %s",
+                                                          rel_prefix + entry.name)
+                                            continue
+                                        self._seen_inodes.add(inode)
+                            add_file((entry.path, rel_prefix + entry.name,
+                                      st.st_size, st.st_mtime_ns))
+                    except OSError as e:
+                        logging.warning("Error processing entry %s in %s: %s", entry.name, dir_path, e)
+                        continue
+        except Exception as e:
+            logging.error(f"Error scanning directory {dir_path}: {e}")
 
-    def scan_directory(self, directory: Path) -> List[Tuple[Path, str]]:
-        """Scan directory recursively and return list of (file_path, relative_path) tuples."""
+    def scan_directory(self, directory) -> List[Tuple[str, str, int, int]]:
+        """Scan directory recursively, returning (file_path, relative_path, size, mtime_ns) tuples."""
         files = []
+        directory = os.fspath(directory)
 
-        try:
-            if not directory.exists():
-                logging.error(f"Directory does not exist: {directory}")
-                return files
+        if not os.path.isdir(directory):
+            logging.error(f"Directory does not exist: {directory}")
+            return files
 
-            for root, dirs, filenames in os.walk(directory):
-                root_path = Path(root)
+        # Stack of (absolute directory path, relative prefix ending in '/')
+        stack = [(directory, "")]
 
-                for filename in filenames:
-                    if self._is_excluded(filename):
-                        logging.debug(f"Excluded: {filename}")
-                        continue
-                    try:
-                        file_path = root_path / filename
-                        if file_path.is_file():
-                            relative_path = file_path.relative_to(self.source_root)
-                            files.append((file_path, str(relative_path)))
-                    except Exception as e:
-                        logging.warning(f"Error processing file {filename} in {root}: {e}")
-                        continue
+        while stack:
+            dir_path, rel_prefix = stack.pop()
+            self._process_directory(dir_path, rel_prefix, files, stack)
 
-        except Exception as e:
-            logging.error(f"Error scanning directory {directory}: {e}")
+        return files
+
+    def _scan_parallel(self, directory: str) -> List[Tuple[str, str, int, int]]:
+        """Scan with multiple worker threads, one directory per work item.
+
+        Directory enumeration is latency-bound (opendir/getdents per
+        directory), so fanning the traversal out across threads hides that
+        latency on slow or networked drives.
+        """
+        files: List[Tuple[str, str, int, int]] = []
+        files_lock = threading.Lock()
+        dir_queue = queue.Queue()
+        dir_queue.put((directory, ""))
+
+        def worker():
+            while True:
+                item = dir_queue.get()
+                if item is None:
+                    dir_queue.task_done()
+                    return
+
+                dir_path, rel_prefix = item
+                found: List[Tuple[str, str, int, int]] = []
+                subdirs: List[Tuple[str, str]] = []
+                self._process_directory(dir_path, rel_prefix, found, subdirs)
+
+                for subdir in subdirs:
+                    dir_queue.put(subdir)
+                if found:
+                    with files_lock:
+                        files.extend(found)
+                dir_queue.task_done()
+
+        threads = [threading.Thread(target=worker, daemon=True)
+                   for _ in range(self.scan_workers)]
+        for thread in threads:
+            thread.start()
+
+        dir_queue.join()
+        for _ in threads:
+            dir_queue.put(None)
+        for thread in threads:
+            thread.join()
 
         return files
-    
-    def get_all_files(self) -> List[Tuple[Path, str]]:
+
+    def _scan_processes(self, directory: str) -> List[Tuple[str, str, int, int]]:
+        """Scan top-level subtrees in worker processes.
+
+        On Windows the warm-cache scan is CPU-bound on path/string handling
+        rather than I/O-bound, so threads serialize on the GIL. Each
+        top-level subdirectory (e.g. a year folder) is scanned in its own
+        process and the results are merged in the parent.
+        """
+        files: List[Tuple[str, str, int, int]] = []
+        subdirs: List[Tuple[str, str]] = []
+        self._process_directory(directory, "", files, subdirs)
+
+        if not subdirs:
+            return files
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [
+                executor.submit(_scan_subtree, subdir, rel_prefix, self.exclude_patterns)
+                for subdir, rel_prefix in subdirs
+            ]
+            for future in futures:
+                try:
+                    files.extend(future.result())
+                except Exception as e:
+                    logging.error(f"Error scanning subtree in worker process: {e}")
+
+        return files
+
+    def get_all_files(self) -> List[Tuple[str, str, int, int]]:
         """Get all files from the source directory."""
         logging.info(f"Scanning files in {self.source_root}...")
-        files = self.scan_directory(self.source_root)
+
+        directory = self.source_root
+        if not os.path.isdir(directory):
+            logging.error(f"Directory does not exist: {directory}")
+            return []
+
+        # Hardlink dedup relies on one shared seen-inode set, which worker
+        # processes cannot share — fall back to the threaded scan for it.
+        if self.scan_workers > 1 and sys.platform == "win32" \
+                and (os.cpu_count() or 1) > 1 and not self.dedup_hardlinks:
+            files = self._scan_processes(directory)
+        elif self.scan_workers > 1:
+            files = self._scan_parallel(directory)
+        else:
+            files = self.scan_directory(directory)
+
         logging.info(f"Found {len(files)} files to process")
         return files
 
+
+def _scan_subtree(subdir: str, rel_prefix: str,
+                  exclude_patterns: List[str]) -> List[Tuple[str, str, int, int]]:
+    """Scan one subtree sequentially; runs in a ProcessPoolExecutor worker."""
+    scanner = FileScanner(subdir, exclude_patterns=exclude_patterns, scan_workers=1)
+    return [(path, rel_prefix + rel, size, mtime_ns)
+            for path, rel, size, mtime_ns in scanner.scan_directory(subdir)]
+
+class ManifestCache:
+    """Local manifest of files known to be synced, keyed by S3 key + size + mtime.
+
+    Lets repeat runs confirm unchanged files without any S3 traffic: a file
+    whose (key, size, mtime_ns) tuple matches its manifest row was already
+    verified or uploaded on an earlier run. Backed by sqlite in WAL mode;
+    writes are batched so fsync cost is amortized across many records.
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "key TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)"
+        )
+        self._conn.commit()
+        # Not-yet-committed records, kept as key -> (size, mtime_ns) so
+        # lookups see them before they are flushed to disk.
+        self._pending = {}
+
+    def is_current(self, key: str, size: int, mtime_ns: int) -> bool:
+        """Check whether a file is unchanged since it was last recorded."""
+        with self._lock:
+            row = self._pending.get(key)
+            if row is None:
+                row = self._conn.execute(
+                    "SELECT size, mtime_ns FROM files WHERE key = ?", (key,)
+                ).fetchone()
+        return row is not None and row[0] == size and row[1] == mtime_ns
+
+    def record(self, key: str, size: int, mtime_ns: int):
+        """Record a file as synced; flushed to disk in batches."""
+        with self._lock:
+            self._pending[key] = (size, mtime_ns)
+            if len(self._pending) >= self.BATCH_SIZE:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO files (key, size, mtime_ns) VALUES (?, ?, ?)",
+            [(key, size, mtime_ns) for key, (size, mtime_ns) in self._pending.items()]
+        )
+        self._conn.commit()
+        self._pending.clear()
+
+    def close(self):
+        with self._lock:
+            if self._pending:
+                self._flush_locked()
+        self._conn.close()
+
+
+# Translation table for converting Windows path separators to S3 key separators
+_SLASH = str.maketrans('\\', '/')
+
+def _should_upload(local_size: int, s3_size: int, s3_exists: bool,
+                   tolerance: int) -> bool:
+    """Decide whether a local file needs uploading.
+
+    Upload when the object is absent, or when the local copy is larger by
+    more than the tolerance. Module-level and integer-only so the classify
+    loop can bind it to a local once and the body is three compares per
+    file — no attribute lookups in the hot path. The existence flag is
+    passed explicitly rather than inferred from size so legitimate
+    zero-byte objects are not re-uploaded forever.
+    """
+    if not s3_exists:
+        return True
+    if s3_size >= local_size:
+        return False
+    return local_size - s3_size > tolerance
+
+
+def _file_md5(path) -> str:
+    """MD5 hex digest of a file, read in 1 MiB blocks."""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
 class BackupVerifier:
     """Handles backup verification and upload operations."""
 
     def __init__(self, s3_manager: S3BackupManager, dry_run: bool = False,
-                 size_tolerance: int = 0):
+                 size_tolerance: int = 0, manifest: ManifestCache = None,
+                 verify_checksum: bool = False):
         self.s3_manager = s3_manager
         self.dry_run = dry_run
         self.size_tolerance = size_tolerance
+        self.manifest = manifest
+        self.verify_checksum = verify_checksum
+
+    def _checksum_matches(self, bucket: str, s3_key: str, file_path) -> bool:
+        """Compare the object's ETag against the local file's MD5.
+
+        A single-part ETag is an MD5 digest only for plaintext and
+        SSE-S3 (AES256) objects; multipart ETags (they contain '-') and
+        SSE-KMS/SSE-C ETags are opaque. Multipart and unknown ETags are
+        treated as matching up front, and an apparent mismatch is confirmed
+        with one HEAD to check the encryption mode — otherwise every
+        same-size file in a KMS-encrypted bucket would re-upload on every
+        run, forever.
+        """
+        etag = self.s3_manager.get_etag(s3_key)
+        if not etag or '-' in etag:
+            return True
+        if _file_md5(file_path) == etag:
+            return True
+
+        try:
+            head = self.s3_manager.s3_client.head_object(Bucket=bucket, Key=s3_key)
+        except Exception as e:
+            logging.warning("Could not confirm encryption mode for %s: %s", s3_key, e)
+            return True
+        if head.get('ServerSideEncryption', 'AES256') != 'AES256' or \
+                'SSECustomerAlgorithm' in head:
+            # Opaque ETag — no comparison is possible, so don't re-upload.
+            return True
+        return False
     
-    def process_files_batch(self, files_batch: List[Tuple[Path, str]], bucket: str, 
+    def process_files_batch(self, files_batch: List[Tuple[str, str, int, int]], bucket: str, 
                            s3_prefix: str) -> BackupStats:
         """Process a batch of files for backup verification."""
         stats = BackupStats()
         
-        # Prepare S3 keys
+        # Prepare S3 keys as parallel arrays — no per-batch mapping dict.
+        # Batch items are (path, relative_path, size, mtime_ns) from the
+        # scanner; shorter tuples are also accepted, in which case the
+        # missing fields are stat'ed lazily below.
+        prefix_plus = s3_prefix + '/' if s3_prefix else ''
         s3_keys = []
-        file_mapping = {}
-        
-        for file_path, relative_path in files_batch:
-            # Convert Windows path separators to forward slashes for S3
-            s3_relative_path = relative_path.replace('\\', '/')
-            s3_key = f"{s3_prefix}/{s3_relative_path}" if s3_prefix else s3_relative_path
-            s3_keys.append(s3_key)
-            file_mapping[s3_key] = (file_path, relative_path)
-        
+        paths = []
+        rel_paths = []
+        sizes = []
+        mtimes = []
+
         stats.total_files_scanned = len(files_batch)
-        
-        # Batch check S3 existence
-        s3_exists_map = self.s3_manager.batch_check_exists(bucket, s3_keys)
-        
-        # Process each file
-        for s3_key in s3_keys:
-            file_path, relative_path = file_mapping[s3_key]
 
+        for item in files_batch:
+            s3_key = prefix_plus + item[1].translate(_SLASH)
+            local_size = item[2] if len(item) > 2 else None
+            mtime_ns = item[3] if len(item) > 3 else None
+
+            # Files whose size and mtime match the local manifest were
+            # verified or uploaded on an earlier run — skip S3 entirely.
+            # Size and mtime normally ride along from the scanner's cached
+            # DirEntry.stat; the stat here is only the legacy-tuple fallback.
+            if self.manifest is not None:
+                if mtime_ns is None:
+                    try:
+                        st = os.stat(item[0])
+                    except OSError as e:
+                        logging.error("Error processing file %s: %s", item[1], e)
+                        stats.scan_errors += 1
+                        continue
+                    local_size = st.st_size
+                    mtime_ns = st.st_mtime_ns
+                if self.manifest.is_current(s3_key, local_size, mtime_ns):
+                    stats.files_already_in_s3 += 1
+                    logging.debug("Unchanged since last sync (manifest): %s", item[1])
+                    continue
+
+            s3_keys.append(s3_key)
+            paths.append(item[0])
+            rel_paths.append(item[1])
+            sizes.append(local_size)
+            mtimes.append(mtime_ns)
+
+        # Batch check S3 existence (skipped when the manifest settled everything)
+        s3_exists_map = self.s3_manager.batch_check_exists(bucket, s3_keys) if s3_keys else {}
+
+        # Classify stage: decide skip-vs-upload for every file against the
+        # cached existence map. Pure comparisons, no network — the uploads
+        # list is the only thing carried into the upload stage.
+        uploads = []
+        decide = _should_upload
+        tolerance = self.size_tolerance
+        for s3_key, file_path, relative_path, local_size, mtime_ns in \
+                zip(s3_keys, paths, rel_paths, sizes, mtimes):
             try:
                 s3_exists, s3_size = s3_exists_map.get(s3_key, (False, 0))
-                local_size = file_path.stat().st_size
-
-                size_diff = abs(local_size - s3_size)
-                if s3_exists and (s3_size >= local_size or size_diff <= self.size_tolerance):
+                if local_size is None:
+                    local_size = os.stat(file_path).st_size
+
+                if not decide(local_size, s3_size, s3_exists, tolerance):
+                    # Same-size objects can still differ in content; with
+                    # --checksum, a single-part ETag that disagrees with the
+                    # local MD5 forces a re-upload.
+                    if self.verify_checksum and s3_size == local_size and \
+                            not self._checksum_matches(bucket, s3_key, file_path):
+                        uploads.append((s3_key, file_path, relative_path,
+                                        local_size, mtime_ns, s3_exists,
+                                        "checksum mismatch"))
+                        continue
                     stats.files_already_in_s3 += 1
-                    logging.debug(f"File already in S3: {relative_path}")
+                    logging.debug("File already in S3: %s", relative_path)
+                    self._record_synced(s3_key, local_size, mtime_ns)
                 else:
                     if s3_exists:
                         reason = f"local file larger (local={local_size}, s3={s3_size})"
                     else:
                         reason = "missing from S3"
+                    uploads.append((s3_key, file_path, relative_path,
+                                    local_size, mtime_ns, s3_exists, reason))
+            except Exception as e:
+                logging.error("Error processing file %s: %s", relative_path, e)
+                stats.scan_errors += 1
 
-                    if self.dry_run:
-                        logging.info(f"[DRY RUN] Would upload ({reason}): {relative_path}")
-                        stats.files_uploaded_to_s3 += 1
-                    else:
-                        logging.info(f"Uploading ({reason}): {relative_path}")
-                        success, bytes_uploaded = self.s3_manager.upload_file(bucket, s3_key, file_path)
-
-                        if success:
-                            stats.files_uploaded_to_s3 += 1
-                            stats.total_bytes_uploaded += bytes_uploaded
-                        else:
-                            stats.upload_failures += 1
-
+        # Upload stage: runs in the calling worker thread. Batches are
+        # already fanned out across the sync-level executor, so a nested
+        # pool here would only oversubscribe the shared connection pool.
+        for s3_key, file_path, relative_path, local_size, mtime_ns, \
+                s3_exists, reason in uploads:
+            if self.dry_run:
+                logging.info("[DRY RUN] Would upload (%s): %s", reason, relative_path)
+                stats.files_uploaded_to_s3 += 1
+                continue
+
+            logging.info("Uploading (%s): %s", reason, relative_path)
+            try:
+                success, bytes_uploaded = self.s3_manager.upload_file(
+                    bucket, s3_key, file_path, file_size=local_size,
+                    if_absent=not s3_exists)
+            except FileExistsError:
+                # Key appeared between the existence check and the PUT —
+                # another writer got there first.
+                stats.files_already_in_s3 += 1
+                continue
             except Exception as e:
-                logging.error(f"Error processing file {relative_path}: {e}")
+                logging.error("Error processing file %s: %s", relative_path, e)
                 stats.scan_errors += 1
-        
+                continue
+
+            if success:
+                stats.files_uploaded_to_s3 += 1
+                stats.total_bytes_uploaded += bytes_uploaded
+                self._record_synced(s3_key, local_size, mtime_ns)
+            else:
+                stats.upload_failures += 1
+
         return stats
 
+    def _record_synced(self, s3_key: str, size: int, mtime_ns: int):
+        """Record a confirmed-synced file in the manifest, if one is in use."""
+        if self.manifest is not None and not self.dry_run and mtime_ns is not None:
+            self.manifest.record(s3_key, size, mtime_ns)
+
 def create_progress() -> Progress:
-    """Create a rich progress bar for file processing."""
+    """Create a rich progress bar for file processing.
+
+    Task updates only ever happen on the main thread (once per completed
+    chunk), so no locking is needed; rendering is throttled to a few frames
+    per second since redraw cost is per-frame, not per-update.
+    """
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -399,15 +958,21 @@ def create_progress() -> Progress:
         MofNCompleteColumn(),
         TimeElapsedColumn(),
         TimeRemainingColumn(),
+        refresh_per_second=4,
     )
 
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 def format_bytes(bytes_count: int) -> str:
-    """Format bytes as human readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_count < 1024.0:
-            return f"{bytes_count:.1f} {unit}"
-        bytes_count /= 1024.0
-    return f"{bytes_count:.1f} PB"
+    """Format bytes as human readable string.
+
+    The unit index is bit_length() // 10 (units step every 2**10), so this
+    is one C-level call and one divide instead of a Python loop.
+    """
+    if bytes_count <= 0:
+        return "0.0 B"
+    idx = min((bytes_count.bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{bytes_count / (1 << (idx * 10)):.1f} {_BYTE_UNITS[idx]}"
 
 def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
                log_file: str, max_workers: int = 4, batch_size: int = 100,
@@ -415,7 +980,11 @@ def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
                endpoint_url: str = None,
                exclude_patterns: List[str] = None,
                delete: bool = False,
-               size_tolerance: int = 0) -> BackupStats:
+               size_tolerance: int = 0,
+               scan_workers: int = 8,
+               manifest_file: str = None,
+               dedup_hardlinks: bool = False,
+               checksum: bool = False) -> BackupStats:
     """
     Sync a local directory to S3, uploading any files not already present.
 
@@ -438,12 +1007,18 @@ def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
     # Clear any existing handlers to prevent accumulation across calls
     logger.handlers.clear()
 
-    # File handler - detailed logging
+    # File handler - detailed logging. Worker threads enqueue records and a
+    # QueueListener thread does the actual disk writes, keeping synchronous
+    # log I/O off the upload hot path.
     file_handler = logging.FileHandler(log_file, mode="w")
     file_handler.setLevel(logging.DEBUG)
     file_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
     file_handler.setFormatter(file_formatter)
 
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+
     # Console handler - verbosity depends on flags
     console_handler = logging.StreamHandler(sys.stdout)
     if debug:
@@ -455,9 +1030,26 @@ def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
     console_formatter = logging.Formatter("%(message)s")
     console_handler.setFormatter(console_formatter)
 
-    logger.addHandler(file_handler)
+    logger.addHandler(queue_handler)
     logger.addHandler(console_handler)
-    
+    listener.start()
+
+    try:
+        return _run_sync(source_path, s3_bucket, s3_prefix, max_workers,
+                         batch_size, dry_run, endpoint_url, exclude_patterns,
+                         delete, size_tolerance, scan_workers, manifest_file,
+                         dedup_hardlinks, checksum)
+    finally:
+        listener.stop()
+
+
+def _run_sync(source_path: str, s3_bucket: str, s3_prefix: str,
+              max_workers: int, batch_size: int, dry_run: bool,
+              endpoint_url: str, exclude_patterns: List[str],
+              delete: bool, size_tolerance: int,
+              scan_workers: int, manifest_file: str,
+              dedup_hardlinks: bool, checksum: bool) -> BackupStats:
+    """Body of sync_to_s3, run with logging handlers already configured."""
     if dry_run:
         logging.info("*** DRY RUN MODE - No files will be uploaded ***")
     
@@ -468,26 +1060,43 @@ def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
     logging.info(f"Max Workers: {max_workers}")
     logging.info(f"Batch Size: {batch_size}")
     
-    source_root = Path(source_path)
-    
     # Validate source path
-    if not source_root.exists():
+    if not os.path.exists(source_path):
         raise ValueError(f"Source directory does not exist: {source_path}")
     
-    # Initialize components
+    # Initialize components. Size the connection pool for the run's real
+    # peak: every upload worker can drive TRANSFER_CONCURRENCY multipart
+    # parts at once, on top of the residual-lookup fan-out — a pool smaller
+    # than that discards and re-handshakes connections under load.
+    pool_size = max(50,
+                    max_workers * S3BackupManager.TRANSFER_CONCURRENCY
+                    + S3BackupManager.LOOKUP_CONCURRENCY)
     s3_manager = S3BackupManager(
-        max_pool_connections=max_workers * 2, endpoint_url=endpoint_url
+        max_pool_connections=pool_size, endpoint_url=endpoint_url
     )
     
     # Validate S3 bucket exists and is accessible
     if not s3_manager.validate_bucket(s3_bucket):
         raise ValueError(f"S3 bucket validation failed: {s3_bucket}")
 
+    # Talk to the bucket's home region directly
+    s3_manager.ensure_bucket_region(s3_bucket)
+
     # Bulk-load existing S3 objects into cache to avoid per-file HEAD requests
-    s3_manager.load_prefix_cache(s3_bucket, s3_prefix)
+    cached_objects = s3_manager.load_prefix_cache(s3_bucket, s3_prefix)
+    logging.info(f"Loaded {cached_objects:,} existing S3 objects into cache")
+
+    scanner = FileScanner(source_path, exclude_patterns=exclude_patterns,
+                          scan_workers=scan_workers,
+                          dedup_hardlinks=dedup_hardlinks)
+
+    manifest = None
+    if manifest_file:
+        logging.info(f"Using local manifest: {manifest_file}")
+        manifest = ManifestCache(manifest_file)
 
-    scanner = FileScanner(source_root, exclude_patterns=exclude_patterns)
-    verifier = BackupVerifier(s3_manager, dry_run, size_tolerance=size_tolerance)
+    verifier = BackupVerifier(s3_manager, dry_run, size_tolerance=size_tolerance,
+                              manifest=manifest, verify_checksum=checksum)
     
     # Scan all files
     all_files = scanner.get_all_files()
@@ -498,62 +1107,74 @@ def sync_to_s3(source_path: str, s3_bucket: str, s3_prefix: str,
     
     total_stats = BackupStats()
 
-    # Process files in batches with parallel execution
-    logging.info(f"Processing {len(all_files):,} files in batches of {batch_size}...")
+    # Process files in parallel through a single long-lived executor so thread
+    # and connection-pool state survive the whole run. Chunks are submitted as
+    # a continuous stream with a bounded number in flight, keeping the
+    # pipeline full without materializing a future per chunk up front.
+    chunk_size = max(1, batch_size // max_workers)
+    max_in_flight = max_workers * 2
+
+    logging.info(f"Processing {len(all_files):,} files in chunks of {chunk_size} "
+                 f"across {max_workers} threads...")
 
     with create_progress() as progress:
         task = progress.add_task("Syncing", total=len(all_files))
 
-        for i in range(0, len(all_files), batch_size):
-            batch = all_files[i:i + batch_size]
-
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                chunk_size = max(1, len(batch) // max_workers)
-                chunks = [batch[j:j + chunk_size] for j in range(0, len(batch), chunk_size)]
-
-                future_to_chunk = {
-                    executor.submit(verifier.process_files_batch, chunk, s3_bucket, s3_prefix): chunk
-                    for chunk in chunks if chunk
-                }
-
-                for future in as_completed(future_to_chunk):
-                    try:
-                        batch_stats = future.result()
-                        total_stats = total_stats + batch_stats
-                        progress.update(task, advance=batch_stats.total_files_scanned)
-                    except Exception as e:
-                        chunk = future_to_chunk[future]
-                        logging.error(f"Error processing batch of {len(chunk)} files: {e}")
-                        total_stats.scan_errors += len(chunk)
-                        progress.update(task, advance=len(chunk))
+        in_flight = {}
+
+        def drain(done_futures):
+            for future in done_futures:
+                chunk = in_flight.pop(future)
+                try:
+                    batch_stats = future.result()
+                    total_stats.merge(batch_stats)
+                    progress.update(task, advance=batch_stats.total_files_scanned)
+                except Exception as e:
+                    logging.error(f"Error processing batch of {len(chunk)} files: {e}")
+                    total_stats.scan_errors += len(chunk)
+                    progress.update(task, advance=len(chunk))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for i in range(0, len(all_files), chunk_size):
+                while len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    drain(done)
+
+                chunk = all_files[i:i + chunk_size]
+                future = executor.submit(verifier.process_files_batch, chunk, s3_bucket, s3_prefix)
+                in_flight[future] = chunk
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                drain(done)
 
     # Delete orphaned S3 objects if requested
     if delete:
         logging.info("Checking for orphaned S3 objects to delete...")
-        local_keys = set()
-        for _, relative_path in all_files:
-            s3_relative_path = relative_path.replace('\\', '/')
-            s3_key = f"{s3_prefix}/{s3_relative_path}" if s3_prefix else s3_relative_path
-            local_keys.add(s3_key)
+        prefix_plus = s3_prefix + '/' if s3_prefix else ''
+        local_keys = {prefix_plus + item[1].translate(_SLASH) for item in all_files}
 
         s3_keys = s3_manager.list_objects(s3_bucket, s3_prefix)
         orphaned = [k for k in s3_keys if k not in local_keys]
 
         if orphaned:
             logging.info(f"Found {len(orphaned):,} orphaned S3 objects")
-            for key in orphaned:
-                if dry_run:
+            if dry_run:
+                for key in orphaned:
                     logging.info(f"[DRY RUN] Would delete: {key}")
-                    total_stats.files_deleted += 1
-                else:
+                total_stats.files_deleted += len(orphaned)
+            else:
+                for key in orphaned:
                     logging.info(f"Deleting: {key}")
-                    if s3_manager.delete_object(s3_bucket, key):
-                        total_stats.files_deleted += 1
-                    else:
-                        total_stats.delete_failures += 1
+                deleted, failed = s3_manager.delete_objects(s3_bucket, orphaned)
+                total_stats.files_deleted += deleted
+                total_stats.delete_failures += failed
         else:
             logging.info("No orphaned S3 objects found")
 
+    if manifest is not None:
+        manifest.close()
+
     # Log final statistics
     logging.info("===== Sync Summary =====")
     logging.info(f"Total files scanned: {total_stats.total_files_scanned:,}")
@@ -589,14 +1210,24 @@ def main():
                        help='Number of worker threads for parallel processing')
     parser.add_argument('--batch-size', type=int, default=100,
                        help='Number of files to process in each batch')
+    parser.add_argument('--scan-threads', type=int, default=8,
+                       help='Number of threads for the directory scan phase')
     parser.add_argument('--exclude', action='append', default=[], metavar='PATTERN',
                        help='Exclude files matching this glob pattern (repeatable, e.g. --exclude "*.lrdata" --exclude ".DS_Store")')
     parser.add_argument('--log-file', type=str, default=None,
                        help='Log file path (default: lightroom_s3_sync_<timestamp>.log)')
     parser.add_argument('--endpoint-url', type=str, default=None,
                        help='Custom S3 endpoint URL for S3-compatible services (e.g. MinIO, Backblaze B2)')
+    parser.add_argument('--manifest-file', type=str, default=None, metavar='PATH',
+                       help='Local sqlite manifest of synced files; unchanged files skip S3 checks on repeat runs')
     parser.add_argument('--size-tolerance', type=int, default=0, metavar='BYTES',
                        help='Ignore size differences up to this many bytes (useful for metadata-only changes)')
+    parser.add_argument('--checksum', action='store_true',
+                       help='Also compare S3 ETags against local MD5s for same-size files '
+                            '(plaintext/SSE-S3 single-part objects only; multipart and '
+                            'SSE-KMS/SSE-C objects cannot be compared and are skipped)')
+    parser.add_argument('--dedup-hardlinks', action='store_true',
+                       help='Upload only one copy of hardlinked files (skip additional links to the same inode)')
     parser.add_argument('--delete', action='store_true',
                        help='Delete S3 objects that no longer exist locally (makes S3 mirror local)')
     parser.add_argument('--dry-run', action='store_true',
@@ -630,7 +1261,11 @@ def main():
                 endpoint_url=args.endpoint_url,
                 exclude_patterns=args.exclude,
                 delete=args.delete,
-                size_tolerance=args.size_tolerance
+                size_tolerance=args.size_tolerance,
+                scan_workers=args.scan_threads,
+                manifest_file=args.manifest_file,
+                dedup_hardlinks=args.dedup_hardlinks,
+                checksum=args.checksum
             )
 
             print(f"\n===== SUMMARY =====")
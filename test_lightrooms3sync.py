@@ -1,4 +1,6 @@
 import os
+from io import BytesIO
+
 import pytest
 from pathlib import Path
 from unittest.mock import patch
@@ -9,6 +11,7 @@ from moto import mock_aws
 from lightrooms3sync import (
     BackupStats,
     FileScanner,
+    ManifestCache,
     S3BackupManager,
     BackupVerifier,
     format_bytes,
@@ -44,6 +47,13 @@ class TestBackupStats:
         assert c.total_bytes_uploaded == 100
         assert c.files_deleted == 4
 
+    def test_merge_in_place(self):
+        a = BackupStats(total_files_scanned=5, files_uploaded_to_s3=2)
+        a.merge(BackupStats(total_files_scanned=3, upload_failures=1))
+        assert a.total_files_scanned == 8
+        assert a.files_uploaded_to_s3 == 2
+        assert a.upload_failures == 1
+
 
 # --- FileScanner ---
 
@@ -57,9 +67,16 @@ class TestFileScanner:
 
         scanner = FileScanner(tmp_path)
         files = scanner.get_all_files()
-        names = sorted(p for _, p in files)
+        names = sorted(p for _, p, _, _ in files)
         assert names == ["a.txt", "sub/b.jpg"]
 
+        sizes = {p: size for _, p, size, _ in files}
+        assert sizes["a.txt"] == len("hello")
+        assert sizes["sub/b.jpg"] == 2
+
+        mtimes = {p: mtime_ns for _, p, _, mtime_ns in files}
+        assert mtimes["a.txt"] == (tmp_path / "a.txt").stat().st_mtime_ns
+
     def test_scan_empty_dir(self, tmp_path):
         scanner = FileScanner(tmp_path)
         assert scanner.get_all_files() == []
@@ -68,6 +85,38 @@ class TestFileScanner:
         scanner = FileScanner(tmp_path / "nope")
         assert scanner.get_all_files() == []
 
+    def test_single_threaded_scan_matches_parallel(self, tmp_path):
+        (tmp_path / "a.txt").write_text("a")
+        sub = tmp_path / "sub" / "nested"
+        sub.mkdir(parents=True)
+        (sub / "b.jpg").write_bytes(b"\xff\xd8")
+
+        parallel = FileScanner(tmp_path).get_all_files()
+        sequential = FileScanner(tmp_path, scan_workers=1).get_all_files()
+        assert sorted(parallel) == sorted(sequential)
+
+    def test_process_pool_scan_matches_sequential(self, tmp_path):
+        (tmp_path / "root.txt").write_text("r")
+        for year in ("2023", "2024"):
+            sub = tmp_path / year
+            sub.mkdir()
+            (sub / "photo.jpg").write_bytes(b"\xff\xd8")
+
+        scanner = FileScanner(tmp_path)
+        assert sorted(scanner._scan_processes(str(tmp_path))) == \
+            sorted(scanner.scan_directory(tmp_path))
+
+    def test_dedup_hardlinks(self, tmp_path):
+        original = tmp_path / "photo.jpg"
+        original.write_bytes(b"\xff\xd8")
+        os.link(original, tmp_path / "link.jpg")
+
+        both = FileScanner(tmp_path).get_all_files()
+        assert len(both) == 2
+
+        deduped = FileScanner(tmp_path, dedup_hardlinks=True).get_all_files()
+        assert len(deduped) == 1
+
     def test_exclude_patterns(self, tmp_path):
         (tmp_path / "photo.jpg").write_bytes(b"\xff\xd8")
         (tmp_path / ".DS_Store").write_bytes(b"\x00")
@@ -76,10 +125,27 @@ class TestFileScanner:
 
         scanner = FileScanner(tmp_path, exclude_patterns=[".DS_Store", "*.lrdata"])
         files = scanner.get_all_files()
-        names = sorted(p for _, p in files)
+        names = sorted(p for _, p, _, _ in files)
         assert names == ["keep.png", "photo.jpg"]
 
 
+# --- ManifestCache ---
+
+
+class TestManifestCache:
+    def test_roundtrip(self, tmp_path):
+        cache = ManifestCache(str(tmp_path / "manifest.db"))
+        cache.record("Photos/a.jpg", 100, 12345)
+        cache.close()
+
+        cache = ManifestCache(str(tmp_path / "manifest.db"))
+        assert cache.is_current("Photos/a.jpg", 100, 12345) is True
+        assert cache.is_current("Photos/a.jpg", 101, 12345) is False
+        assert cache.is_current("Photos/a.jpg", 100, 99999) is False
+        assert cache.is_current("Photos/other.jpg", 100, 12345) is False
+        cache.close()
+
+
 # --- format_bytes ---
 
 
@@ -100,32 +166,60 @@ class TestFormatBytes:
 # --- S3BackupManager (moto) ---
 
 
-@mock_aws
+@pytest.fixture(scope="class")
+def s3():
+    """One moto context and client per test class.
+
+    Entering mock_aws and building the client once amortizes botocore's
+    service-model parsing across the class instead of paying it per test.
+    """
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def _empty_bucket_between_tests(request):
+    """Purge the shared bucket after each test that used the s3 fixture.
+
+    Guarded on fixturenames rather than depending on s3 directly, so tests
+    that never touch S3 don't drag in the moto context.
+    """
+    yield
+    if "s3" not in request.fixturenames:
+        return
+    s3 = request.getfixturevalue("s3")
+    contents = s3.list_objects_v2(Bucket=BUCKET).get("Contents", [])
+    if contents:
+        s3.delete_objects(
+            Bucket=BUCKET,
+            Delete={"Objects": [{"Key": o["Key"]} for o in contents]},
+        )
+
+
 class TestS3BackupManager:
-    def _create_bucket(self):
-        s3 = boto3.client("s3", region_name="us-east-1")
-        s3.create_bucket(Bucket=BUCKET)
-        return s3
+    def test_validate_bucket(self, s3):
+        mgr = S3BackupManager()
+        assert mgr.validate_bucket(BUCKET) is True
 
-    def test_validate_bucket(self):
-        self._create_bucket()
+    def test_ensure_bucket_region(self, s3):
         mgr = S3BackupManager()
+        mgr.ensure_bucket_region(BUCKET)
+        assert mgr.s3_client.meta.region_name == "us-east-1"
         assert mgr.validate_bucket(BUCKET) is True
 
-    def test_validate_bucket_missing(self):
-        self._create_bucket()
+    def test_validate_bucket_missing(self, s3):
         mgr = S3BackupManager()
         assert mgr.validate_bucket("no-such-bucket") is False
 
-    def test_file_exists_not_found(self):
-        self._create_bucket()
+    def test_file_exists_not_found(self, s3):
         mgr = S3BackupManager()
         exists, size = mgr.file_exists(BUCKET, "nope.txt")
         assert exists is False
         assert size == 0
 
-    def test_upload_and_exists(self, tmp_path):
-        self._create_bucket()
+    def test_upload_and_exists(self, s3, tmp_path):
         mgr = S3BackupManager()
 
         f = tmp_path / "test.txt"
@@ -139,8 +233,19 @@ class TestS3BackupManager:
         assert exists is True
         assert size == len("hello world")
 
-    def test_load_prefix_cache(self, tmp_path):
-        s3 = self._create_bucket()
+    def test_upload_fileobj(self, s3):
+        mgr = S3BackupManager()
+
+        success, uploaded = mgr.upload_file(
+            BUCKET, "Photos/mem.txt", BytesIO(b"hello world"))
+        assert success is True
+        assert uploaded == len("hello world")
+
+        exists, size = mgr.file_exists(BUCKET, "Photos/mem.txt")
+        assert exists is True
+        assert size == len("hello world")
+
+    def test_load_prefix_cache(self, s3):
         s3.put_object(Bucket=BUCKET, Key="Photos/a.jpg", Body=b"aaa")
         s3.put_object(Bucket=BUCKET, Key="Photos/b.jpg", Body=b"bb")
         s3.put_object(Bucket=BUCKET, Key="Other/c.jpg", Body=b"c")
@@ -154,8 +259,50 @@ class TestS3BackupManager:
         assert exists is True
         assert size == 3
 
-    def test_list_objects(self):
-        s3 = self._create_bucket()
+    def test_upload_if_absent(self, s3, tmp_path):
+        s3.put_object(Bucket=BUCKET, Key="Photos/taken.txt", Body=b"existing")
+
+        mgr = S3BackupManager()
+        f = tmp_path / "test.txt"
+        f.write_text("new")
+
+        # Conditional PUT against an existing key is rejected by S3
+        with pytest.raises(FileExistsError):
+            mgr.upload_file(BUCKET, "Photos/taken.txt", f, if_absent=True)
+
+        # ...and succeeds for a fresh key
+        success, uploaded = mgr.upload_file(BUCKET, "Photos/fresh.txt", f, if_absent=True)
+        assert success is True
+        assert uploaded == 3
+
+    def test_prefix_cache_answers_missing_keys_without_head(self, s3):
+        s3.put_object(Bucket=BUCKET, Key="Photos/a.jpg", Body=b"aaa")
+
+        mgr = S3BackupManager()
+        mgr.load_prefix_cache(BUCKET, "Photos")
+
+        # Once the prefix is loaded, misses must not fall back to HEAD
+        with patch.object(mgr.s3_client, "head_object",
+                          side_effect=AssertionError("unexpected HEAD request")):
+            exists, size = mgr.file_exists(BUCKET, "Photos/missing.jpg")
+        assert exists is False
+        assert size == 0
+
+    def test_file_exists_warms_parent_prefix(self, s3):
+        s3.put_object(Bucket=BUCKET, Key="Photos/a.jpg", Body=b"aaa")
+        s3.put_object(Bucket=BUCKET, Key="Photos/b.jpg", Body=b"bbbb")
+
+        mgr = S3BackupManager()
+
+        # The first lookup lists the parent prefix instead of HEADing, so
+        # sibling keys are answered from cache with no further requests.
+        with patch.object(mgr.s3_client, "head_object",
+                          side_effect=AssertionError("unexpected HEAD request")):
+            assert mgr.file_exists(BUCKET, "Photos/a.jpg") == (True, 3)
+            assert mgr.file_exists(BUCKET, "Photos/b.jpg") == (True, 4)
+            assert mgr.file_exists(BUCKET, "Photos/missing.jpg") == (False, 0)
+
+    def test_list_objects(self, s3):
         s3.put_object(Bucket=BUCKET, Key="Photos/a.jpg", Body=b"a")
         s3.put_object(Bucket=BUCKET, Key="Photos/sub/b.jpg", Body=b"b")
 
@@ -163,8 +310,7 @@ class TestS3BackupManager:
         keys = mgr.list_objects(BUCKET, "Photos")
         assert sorted(keys) == ["Photos/a.jpg", "Photos/sub/b.jpg"]
 
-    def test_delete_object(self):
-        s3 = self._create_bucket()
+    def test_delete_object(self, s3):
         s3.put_object(Bucket=BUCKET, Key="Photos/a.jpg", Body=b"a")
 
         mgr = S3BackupManager()
@@ -173,8 +319,19 @@ class TestS3BackupManager:
         exists, _ = mgr.file_exists(BUCKET, "Photos/a.jpg")
         assert exists is False
 
-    def test_batch_check_exists(self):
-        s3 = self._create_bucket()
+    def test_delete_objects_batch(self, s3):
+        for key in ("Photos/a.jpg", "Photos/b.jpg", "Photos/c.jpg"):
+            s3.put_object(Bucket=BUCKET, Key=key, Body=b"x")
+
+        mgr = S3BackupManager()
+        deleted, failed = mgr.delete_objects(
+            BUCKET, ["Photos/a.jpg", "Photos/b.jpg"])
+        assert (deleted, failed) == (2, 0)
+
+        assert mgr.file_exists(BUCKET, "Photos/a.jpg")[0] is False
+        assert mgr.file_exists(BUCKET, "Photos/c.jpg")[0] is True
+
+    def test_batch_check_exists(self, s3):
         s3.put_object(Bucket=BUCKET, Key="Photos/yes.jpg", Body=b"data")
 
         mgr = S3BackupManager()
@@ -186,16 +343,9 @@ class TestS3BackupManager:
 # --- BackupVerifier (moto) ---
 
 
-@mock_aws
 class TestBackupVerifier:
-    def _setup(self, tmp_path):
-        s3 = boto3.client("s3", region_name="us-east-1")
-        s3.create_bucket(Bucket=BUCKET)
+    def test_uploads_missing_files(self, s3, tmp_path):
         mgr = S3BackupManager()
-        return s3, mgr
-
-    def test_uploads_missing_files(self, tmp_path):
-        s3, mgr = self._setup(tmp_path)
 
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"\xff\xd8\xff\xe0" * 100)
@@ -207,8 +357,8 @@ class TestBackupVerifier:
         assert stats.files_uploaded_to_s3 == 1
         assert stats.total_bytes_uploaded == f.stat().st_size
 
-    def test_skips_existing_same_size(self, tmp_path):
-        s3, mgr = self._setup(tmp_path)
+    def test_skips_existing_same_size(self, s3, tmp_path):
+        mgr = S3BackupManager()
 
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"content")
@@ -221,8 +371,8 @@ class TestBackupVerifier:
         assert stats.files_already_in_s3 == 1
         assert stats.files_uploaded_to_s3 == 0
 
-    def test_reuploads_when_local_larger(self, tmp_path):
-        s3, mgr = self._setup(tmp_path)
+    def test_reuploads_when_local_larger(self, s3, tmp_path):
+        mgr = S3BackupManager()
 
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"new content that is longer")
@@ -235,8 +385,8 @@ class TestBackupVerifier:
         assert stats.files_uploaded_to_s3 == 1
         assert stats.files_already_in_s3 == 0
 
-    def test_skips_when_s3_larger(self, tmp_path):
-        s3, mgr = self._setup(tmp_path)
+    def test_skips_when_s3_larger(self, s3, tmp_path):
+        mgr = S3BackupManager()
 
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"short")
@@ -249,8 +399,8 @@ class TestBackupVerifier:
         assert stats.files_already_in_s3 == 1
         assert stats.files_uploaded_to_s3 == 0
 
-    def test_skips_within_size_tolerance(self, tmp_path):
-        s3, mgr = self._setup(tmp_path)
+    def test_skips_within_size_tolerance(self, s3, tmp_path):
+        mgr = S3BackupManager()
 
         f = tmp_path / "photo.dng"
         f.write_bytes(b"local content!!")  # 15 bytes
@@ -263,8 +413,51 @@ class TestBackupVerifier:
         assert stats.files_already_in_s3 == 1
         assert stats.files_uploaded_to_s3 == 0
 
-    def test_dry_run_no_upload(self, tmp_path):
-        _, mgr = self._setup(tmp_path)
+    def test_checksum_reuploads_same_size_modified_file(self, s3, tmp_path):
+        mgr = S3BackupManager()
+
+        f = tmp_path / "photo.jpg"
+        f.write_bytes(b"new bytes")
+        s3.put_object(Bucket=BUCKET, Key="Photos/photo.jpg", Body=b"old bytes")
+
+        # Same size, so the default size check skips it...
+        stats = BackupVerifier(mgr, dry_run=False).process_files_batch(
+            [(f, "photo.jpg")], BUCKET, PREFIX)
+        assert stats.files_already_in_s3 == 1
+
+        # ...but the checksum comparison catches the changed content
+        mgr = S3BackupManager()
+        verifier = BackupVerifier(mgr, dry_run=False, verify_checksum=True)
+        stats = verifier.process_files_batch([(f, "photo.jpg")], BUCKET, PREFIX)
+        assert stats.files_uploaded_to_s3 == 1
+
+        # A second pass sees matching content and skips
+        mgr = S3BackupManager()
+        verifier = BackupVerifier(mgr, dry_run=False, verify_checksum=True)
+        stats = verifier.process_files_batch([(f, "photo.jpg")], BUCKET, PREFIX)
+        assert stats.files_already_in_s3 == 1
+
+    def test_manifest_skips_unchanged_files_without_s3(self, s3, tmp_path):
+        mgr = S3BackupManager()
+
+        f = tmp_path / "photo.jpg"
+        f.write_bytes(b"content")
+
+        manifest = ManifestCache(str(tmp_path / "manifest.db"))
+        verifier = BackupVerifier(mgr, dry_run=False, manifest=manifest)
+        stats = verifier.process_files_batch([(f, "photo.jpg")], BUCKET, PREFIX)
+        assert stats.files_uploaded_to_s3 == 1
+
+        # Second pass over an unchanged file must not touch S3 at all
+        with patch.object(mgr, "batch_check_exists",
+                          side_effect=AssertionError("unexpected S3 check")):
+            stats = verifier.process_files_batch([(f, "photo.jpg")], BUCKET, PREFIX)
+        assert stats.files_already_in_s3 == 1
+        assert stats.files_uploaded_to_s3 == 0
+        manifest.close()
+
+    def test_dry_run_no_upload(self, s3, tmp_path):
+        mgr = S3BackupManager()
 
         f = tmp_path / "photo.jpg"
         f.write_bytes(b"data")